@@ -24,13 +24,14 @@ import asyncio
 import os
 from typing import Any, Dict, List, Optional, Union
 
-from .constants import LIBRARY_NAME, VERSION, get_environment_type
+from .constants import LIBRARY_NAME, VERSION, get_environment_type, invalidate_env_cache
 from .exceptions import *
 from .manager import SecureLoaderManager
-from .secure import SecureEnvLoader
+from .secure import LoadOptions, SecureEnvLoader
 
 # Import all classes and exceptions
 from .simple import SimpleEnvLoader, load_env, load_env_sync
+from .utils import _clear_caches
 
 # Type definitions
 EnvValue = Union[str, int, bool]
@@ -44,6 +45,8 @@ __description__ = "Ultra-secure, high-performance .env file loader"
 # Global instances for convenience API
 _simple_loader: Optional[SimpleEnvLoader] = None
 _secure_loader: Optional[SecureEnvLoader] = None
+# Loaded global loader used directly by the secure getters (see clear())
+_bound_secure_loader: Optional[SecureEnvLoader] = None
 
 # Global SecureLoaderManager instance
 _secure_manager = SecureLoaderManager()
@@ -154,13 +157,12 @@ def load_secure(
     if _secure_loader is None:
         _secure_loader = SecureEnvLoader()
 
-    from .secure import LoadOptions
-
     options = LoadOptions(path=path, max_depth=max_depth, strict_validation=strict)
     try:
         # 현재 실행 중인 이벤트 루프 가져오기
         loop = asyncio.get_running_loop()
         task = loop.create_task(_secure_loader.load_secure(options))
+        task.add_done_callback(_bind_secure_loader_on_success)
 
         # 현재 태스크가 루프의 유일한 태스크인지 확인 (기본 태스크 외에 다른 태스크가 없는 경우)
         if len(asyncio.all_tasks(loop)) <= 1:
@@ -169,6 +171,7 @@ def load_secure(
 
     except RuntimeError:
         asyncio.run(_secure_loader.load_secure(options))
+        _bind_secure_loader(_secure_loader)
     # Update manager reference
     _secure_manager._global_loader_ref = _secure_loader
 
@@ -193,10 +196,9 @@ async def load_secure_async(
     if _secure_loader is None:
         _secure_loader = SecureEnvLoader()
 
-    from .secure import LoadOptions
-
     options = LoadOptions(path=path, max_depth=max_depth, strict_validation=strict)
     await _secure_loader.load_secure(options)
+    _bind_secure_loader(_secure_loader)
 
     # Update manager reference
     _secure_manager._global_loader_ref = _secure_loader
@@ -249,28 +251,65 @@ def get_secure(key: str, default: Optional[EnvValue] = None) -> Optional[EnvValu
     Note:
         This accesses memory-isolated data, not system environment
     """
-    loader = _secure_manager.get_active_loader()
+    loader = _active_secure_loader()
     return loader.get_secure(key) if loader else default
 
 
 def get_int_secure(key: str, default: Optional[int] = None) -> Optional[int]:
     """Get secure environment variable as integer"""
-    loader = _secure_manager.get_active_loader()
+    loader = _active_secure_loader()
     return loader.get_int_secure(key, default) if loader else default
 
 
 def get_bool_secure(key: str, default: Optional[bool] = None) -> Optional[bool]:
     """Get secure environment variable as boolean"""
-    loader = _secure_manager.get_active_loader()
+    loader = _active_secure_loader()
     return loader.get_bool_secure(key, default) if loader else default
 
 
 def get_str_secure(key: str, default: Optional[str] = None) -> Optional[str]:
     """Get secure environment variable as string"""
-    loader = _secure_manager.get_active_loader()
+    loader = _active_secure_loader()
     return loader.get_str_secure(key, default) if loader else default
 
 
+def _active_secure_loader() -> Optional[SecureEnvLoader]:
+    """Loader behind the module-level secure getters"""
+    # Fast path: the global loader bound by a successful load_secure(); the
+    # getters stay the same functions, so `from simpleenvs import ...` works
+    loader = _bound_secure_loader
+    if loader is not None and loader.is_loaded():
+        return loader
+    return _secure_manager.get_active_loader()
+
+
+def _bind_secure_loader(loader: Optional[SecureEnvLoader]) -> None:
+    """Point the secure getters' fast path at loader (None unbinds)"""
+    global _bound_secure_loader
+    _bound_secure_loader = loader
+
+
+def _bind_secure_loader_on_success(task: "asyncio.Task[None]") -> None:
+    """Done callback for background load_secure tasks"""
+    if task.cancelled():
+        return
+
+    error = task.exception()
+    if error is not None:
+        # Retrieving the exception silences asyncio's own report; re-raise it
+        # through the task's loop so a failed background load stays visible
+        loop = task.get_loop() if hasattr(task, "get_loop") else task._loop  # 3.7
+        loop.call_exception_handler(
+            {
+                "message": "Background load_secure() failed",
+                "exception": error,
+                "task": task,
+            }
+        )
+    elif _secure_loader:
+        _bind_secure_loader(_secure_loader)
+
+
 def is_loaded_secure() -> bool:
     """Check if secure environment is loaded"""
     return bool(_secure_manager)  # Uses SecureLoaderManager.__bool__()
@@ -294,18 +333,21 @@ def get_all_secure_loaders() -> List[SecureEnvLoader]:
 
 def get_all_keys() -> List[str]:
     """Get all available environment variable keys"""
-    keys = set()
-
     # From simple loader (system environment)
-    if _simple_loader and _simple_loader.is_loaded():
-        keys.update(_simple_loader.keys())
+    simple_keys = (
+        _simple_loader.keys() if _simple_loader and _simple_loader.is_loaded() else ()
+    )
 
     # From secure loader (memory-isolated) - using manager
     active_secure_loader = _secure_manager.get_active_loader()
-    if active_secure_loader:
-        keys.update(active_secure_loader.get_all_keys_secure())
+    if not active_secure_loader:
+        return sorted(simple_keys)
+
+    secure_keys = active_secure_loader.get_all_keys_secure()
+    if not simple_keys:
+        return sorted(secure_keys)
 
-    return sorted(list(keys))
+    return sorted({*simple_keys, *secure_keys})
 
 
 def clear() -> None:
@@ -318,6 +360,9 @@ def clear() -> None:
     if _secure_loader:
         _secure_loader.secure_wipe()
         _secure_loader = None
+    _bind_secure_loader(None)
+    invalidate_env_cache()
+    _clear_caches()
 
     # 메모리에서 모든 로더 강제 삭제
     _secure_manager.force_delete_all_loaders()  # 이 메서드가 _global_loader_ref = None도 처리함
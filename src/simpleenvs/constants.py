@@ -4,7 +4,8 @@ SimpleEnvs: Configuration constants and security limits
 """
 
 import os
-from typing import List, Set, Tuple
+from functools import lru_cache
+from typing import FrozenSet, List, Set, Tuple
 
 # =============================================================================
 # SECURITY LIMITS
@@ -56,6 +57,14 @@ DANGEROUS_PATTERNS: Set[str] = {
     "shell=True",
 }
 
+# Script injection markers, reported separately from DANGEROUS_PATTERNS
+SCRIPT_INJECTION_PATTERNS: Tuple[str, ...] = (
+    "<script",
+    "</script>",
+    "javascript:",
+    "vbscript:",
+)
+
 # Suspicious file extensions
 SUSPICIOUS_EXTENSIONS: Set[str] = {
     ".exe",
@@ -99,35 +108,40 @@ ALLOWED_FILE_SIGNATURES: Set[bytes] = {
 # BOOLEAN VALUE MAPPINGS
 # =============================================================================
 
-# True values (case-insensitive)
-TRUE_VALUES: Set[str] = {
-    "true",
-    "yes",
-    "1",
-    "on",
-    "enable",
-    "enabled",
-    "active",
-    "ok",
-    "y",
-    "t",
-}
+# True values (case-insensitive); frozen so they can't drift from lookups
+# built from them at import time
+TRUE_VALUES: FrozenSet[str] = frozenset(
+    {
+        "true",
+        "yes",
+        "1",
+        "on",
+        "enable",
+        "enabled",
+        "active",
+        "ok",
+        "y",
+        "t",
+    }
+)
 
 # False values (case-insensitive)
-FALSE_VALUES: Set[str] = {
-    "false",
-    "no",
-    "0",
-    "off",
-    "disable",
-    "disabled",
-    "inactive",
-    "n",
-    "f",
-    "null",
-    "none",
-    "",
-}
+FALSE_VALUES: FrozenSet[str] = frozenset(
+    {
+        "false",
+        "no",
+        "0",
+        "off",
+        "disable",
+        "disabled",
+        "inactive",
+        "n",
+        "f",
+        "null",
+        "none",
+        "",
+    }
+)
 
 # =============================================================================
 # FILE PATTERNS
@@ -227,9 +241,13 @@ SECURITY_EVENTS: Set[str] = {
 
 # Buffer sizes
 READ_BUFFER_SIZE = 8192  # 8KB
-HASH_BUFFER_SIZE = 4096  # 4KB
+HASH_BUFFER_SIZE = 1024 * 1024  # 1MB
+MMAP_HASH_THRESHOLD = 2 * 1024 * 1024  # Hash files from 2MB up via mmap
 WRITE_BUFFER_SIZE = 4096  # 4KB
 
+# Files below this size are parsed inline by async loaders (1MB)
+ASYNC_READ_THRESHOLD = 1024 * 1024
+
 # Timeout settings (in seconds)
 FILE_READ_TIMEOUT = 30
 NETWORK_TIMEOUT = 10
@@ -360,7 +378,16 @@ HOMEPAGE = "https://github.com/vmintf/SimpleEnvs-Python"
 
 def get_environment_type() -> str:
     """Detect current environment type"""
-    env_type = os.getenv("ENVIRONMENT", os.getenv("ENV", "development")).lower()
+    env_type = os.environ.get("ENVIRONMENT")
+    if env_type is None:
+        env_type = os.environ.get("ENV", "development")
+    return _classify_environment(env_type)
+
+
+@lru_cache(maxsize=None)
+def _classify_environment(env_type: str) -> str:
+    """Map a raw ENVIRONMENT/ENV value to its environment type (memoized)"""
+    env_type = env_type.lower()
 
     if env_type in ("prod", "production"):
         return "production"
@@ -374,14 +401,32 @@ def get_environment_type() -> str:
 
 def get_settings_for_environment() -> dict:
     """Get settings based on current environment"""
-    env_type = get_environment_type()
+    # Copy so callers can't modify the shared settings
+    return _settings_for(get_environment_type()).copy()
+
 
+@lru_cache(maxsize=None)
+def _settings_for(env_type: str) -> dict:
+    """Settings dictionary for an environment type (memoized)"""
     if env_type == "production":
-        return PROD_SETTINGS.copy()
+        return PROD_SETTINGS
     elif env_type == "testing":
-        return TEST_SETTINGS.copy()
+        return TEST_SETTINGS
     else:
-        return DEV_SETTINGS.copy()
+        return DEV_SETTINGS
+
+
+def invalidate_env_cache() -> None:
+    """
+    Drop memoized environment lookups
+
+    Caches are keyed on the raw ENVIRONMENT/ENV value, so changing
+    os.environ at runtime is picked up without calling this; it only
+    releases the memoized entries.
+    """
+    _classify_environment.cache_clear()
+    _settings_for.cache_clear()
+    _max_value_for.cache_clear()
 
 
 def is_feature_enabled(feature_name: str) -> bool:
@@ -391,8 +436,20 @@ def is_feature_enabled(feature_name: str) -> bool:
 
 def get_max_value_for_environment(setting_name: str) -> int:
     """Get environment-specific maximum values"""
-    env_type = get_environment_type()
+    return _max_value_for(get_environment_type(), setting_name)
+
 
+# Base limits scaled by get_max_value_for_environment
+_BASE_MAX_VALUES = {
+    "max_file_size": MAX_FILE_SIZE,
+    "max_entries": MAX_ENTRIES_PER_DIRECTORY,
+    "max_variables": MAX_VARIABLE_COUNT,
+}
+
+
+@lru_cache(maxsize=32)
+def _max_value_for(env_type: str, setting_name: str) -> int:
+    """Scaled limit for an environment type and setting (memoized)"""
     # Stricter limits in production
     if env_type == "production":
         multiplier = 0.8
@@ -401,13 +458,7 @@ def get_max_value_for_environment(setting_name: str) -> int:
     else:
         multiplier = 1.0
 
-    base_values = {
-        "max_file_size": MAX_FILE_SIZE,
-        "max_entries": MAX_ENTRIES_PER_DIRECTORY,
-        "max_variables": MAX_VARIABLE_COUNT,
-    }
-
-    base_value = base_values.get(setting_name, 1000)
+    base_value = _BASE_MAX_VALUES.get(setting_name, 1000)
     return int(base_value * multiplier)
 
 
@@ -180,36 +180,39 @@ def format_security_error(error: EnvSecurityError) -> str:
     return f"[SECURITY] {error.__class__.__name__}: {error.message}"
 
 
+_CRITICAL_ERRORS = (
+    PathTraversalError,
+    AccessDeniedError,
+    IntegrityError,
+    MemorySecurityError,
+)
+
+_ERROR_CODES = {
+    SimpleEnvsError: "SE001",
+    EnvSecurityError: "SE100",
+    PathTraversalError: "SE101",
+    FileSizeError: "SE102",
+    InvalidInputError: "SE103",
+    AccessDeniedError: "SE104",
+    IntegrityError: "SE105",
+    SessionError: "SE106",
+    MemorySecurityError: "SE107",
+    FileParsingError: "SE200",
+    EnvNotLoadedError: "SE201",
+    KeyNotFoundError: "SE202",
+    TypeConversionError: "SE203",
+    ConfigurationError: "SE300",
+}
+
+
 def is_security_critical(error: Exception) -> bool:
     """Check if error is security-critical"""
-    critical_errors = (
-        PathTraversalError,
-        AccessDeniedError,
-        IntegrityError,
-        MemorySecurityError,
-    )
-    return isinstance(error, critical_errors)
+    return isinstance(error, _CRITICAL_ERRORS)
 
 
 def get_error_code(error: SimpleEnvsError) -> str:
     """Get error code for programmatic handling"""
-    error_codes = {
-        SimpleEnvsError: "SE001",
-        EnvSecurityError: "SE100",
-        PathTraversalError: "SE101",
-        FileSizeError: "SE102",
-        InvalidInputError: "SE103",
-        AccessDeniedError: "SE104",
-        IntegrityError: "SE105",
-        SessionError: "SE106",
-        MemorySecurityError: "SE107",
-        FileParsingError: "SE200",
-        EnvNotLoadedError: "SE201",
-        KeyNotFoundError: "SE202",
-        TypeConversionError: "SE203",
-        ConfigurationError: "SE300",
-    }
-    return error_codes.get(type(error), "SE000")
+    return _ERROR_CODES.get(type(error), "SE000")
 
 
 # Exception context manager for secure error handling
@@ -239,26 +242,32 @@ class SecureErrorHandler:
 
 
 # Custom exception handler for different environments
+def _format_development_error(error: Exception) -> str:
+    """Show full details in development"""
+    if isinstance(error, SimpleEnvsError):
+        return f"{error.__class__.__name__}: {error.message} | Details: {error.details}"
+    return str(error)
+
+
+def _format_production_error(error: Exception) -> str:
+    """Hide sensitive details in production"""
+    if isinstance(error, EnvSecurityError):
+        return f"Security error occurred. Error code: {get_error_code(error)}"
+    elif isinstance(error, SimpleEnvsError):
+        return f"Configuration error. Error code: {get_error_code(error)}"
+    return "An unexpected error occurred."
+
+
+_ERROR_FORMATTERS = {
+    "development": _format_development_error,
+    "production": _format_production_error,
+}
+
+
 def handle_simpleenvs_error(error: Exception, environment: str = "production") -> str:
     """Handle SimpleEnvs errors based on environment"""
-
-    if environment == "development":
-        # Show full details in development
-        if isinstance(error, SimpleEnvsError):
-            return f"{error.__class__.__name__}: {error.message} | Details: {error.details}"
-        return str(error)
-
-    elif environment == "production":
-        # Hide sensitive details in production
-        if isinstance(error, EnvSecurityError):
-            return f"Security error occurred. Error code: {get_error_code(error)}"
-        elif isinstance(error, SimpleEnvsError):
-            return f"Configuration error. Error code: {get_error_code(error)}"
-        return "An unexpected error occurred."
-
-    else:
-        # Default handling
-        return str(error)
+    # Unknown environments fall back to the plain message
+    return _ERROR_FORMATTERS.get(environment, str)(error)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 import gc
 from typing import List, Optional
 
-from .secure import SecureEnvLoader
+from .secure import _LOADER_REGISTRY, SecureEnvLoader
 from .utils import EnvValue
 
 
@@ -41,28 +41,19 @@ class SecureLoaderManager:
         """
         Find existing SecureEnvLoader instance in memory
         """
-        try:
-            for obj in gc.get_objects():
-                if isinstance(obj, SecureEnvLoader):
-                    # Safe access to private attribute using getattr
-                    env_data = getattr(obj, "_SecureEnvLoader__env_data", None)
-                    if env_data:  # Has loaded data
-                        return obj
-        except Exception:
-            pass  # Silently fail if introspection not possible
+        # Loaders register themselves, so no gc.get_objects() heap walk is needed
+        for obj in self.get_all_loaders():
+            # Safe access to private attribute using getattr
+            env_data = getattr(obj, "_SecureEnvLoader__env_data", None)
+            if env_data:  # Has loaded data
+                return obj
 
         return None
 
     def get_all_loaders(self) -> List[SecureEnvLoader]:
         """Get all SecureEnvLoader instances in memory (for debugging)"""
-        loaders = []
-        try:
-            for obj in gc.get_objects():
-                if isinstance(obj, SecureEnvLoader):
-                    loaders.append(obj)
-        except Exception:
-            pass
-        return loaders
+        # Snapshot: the weak registry may shrink while callers iterate
+        return list(_LOADER_REGISTRY)
 
     def force_delete_all_loaders(self) -> None:
         """
@@ -27,6 +27,7 @@ from .constants import (
     MAX_LINE_LENGTH,
     MAX_SCAN_DEPTH,
     MAX_VALUE_LENGTH,
+    SCRIPT_INJECTION_PATTERNS,
     TRUE_VALUES,
 )
 
@@ -42,6 +43,7 @@ from .exceptions import (
     PathTraversalError,
     SessionError,
 )
+from .utils import _io_executor, calculate_file_hash
 
 # Type definitions
 EnvValue = Union[str, int, bool]
@@ -55,9 +57,25 @@ class LoadOptions:
     strict_validation: bool = True
 
 
+# Live SecureEnvLoader instances; entries vanish when a loader is collected
+_LOADER_REGISTRY = weakref.WeakSet()
+
+
 class SecureEnvLoader:
     """Ultra-secure environment variable loader with defense-in-depth"""
 
+    # No instance __dict__: private state only lives in these slots
+    __slots__ = (
+        "__env_data",
+        "__file_hashes",
+        "__access_log",
+        "__session_id",
+        "__creation_time",
+        "__access_count",
+        "__cleanup_ref",
+        "__weakref__",
+    )
+
     def __init__(self, session_id: Optional[str] = None):
         # Private data storage with name mangling
         self.__env_data: EnvMap = {}
@@ -70,6 +88,9 @@ class SecureEnvLoader:
         # Weak reference for automatic cleanup
         self.__cleanup_ref = weakref.finalize(self, self.__cleanup_handler)
 
+        # Register for lookups by SecureLoaderManager
+        _LOADER_REGISTRY.add(self)
+
     def __generate_session_id(self) -> str:
         """Generate secure session identifier"""
         data = f"{time.time()}{os.getpid()}{id(self)}".encode()
@@ -152,18 +173,14 @@ class SecureEnvLoader:
             if pattern in content_lower:
                 raise InvalidInputError(f"Dangerous pattern detected: {pattern}")
 
-        script_patterns = ["<script", "</script>", "javascript:", "vbscript:"]
-        for pattern in script_patterns:
+        for pattern in SCRIPT_INJECTION_PATTERNS:
             if pattern in content_lower:
                 raise InvalidInputError(f"Script injection pattern detected: {pattern}")
 
     def __calculate_file_hash(self, file_path: str) -> str:
         """Calculate SHA-256 hash of file for integrity checking"""
-        hasher = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+        # Shares the mmap/file_digest path; OpenSSL picks SHA-NI when present
+        return calculate_file_hash(file_path, "sha256")
 
     def __validate_key_value(self, key: str, value: str) -> None:
         """Validate key-value pair security constraints"""
@@ -180,8 +197,9 @@ class SecureEnvLoader:
             raise InvalidInputError(f"Value too long: {len(value)} chars")
 
         # Check for potential injection patterns
+        value_lower = value.lower()
         for pattern in DANGEROUS_PATTERNS:
-            if pattern in value.lower():
+            if pattern in value_lower:
                 raise InvalidInputError(f"Potentially dangerous pattern: {pattern}")
 
     def __parse_value_secure(self, value: str) -> EnvValue:
@@ -189,9 +207,10 @@ class SecureEnvLoader:
         value = value.strip()
 
         # Boolean parsing with strict validation
-        if value.lower() in TRUE_VALUES:
+        value_lower = value.lower()
+        if value_lower in TRUE_VALUES:
             return True
-        if value.lower() in FALSE_VALUES:
+        if value_lower in FALSE_VALUES:
             return False
 
         # Number parsing with range validation
@@ -231,7 +250,9 @@ class SecureEnvLoader:
                     content = file.read()
             else:
                 # 큰 파일만 비동기로 (청크 단위 또는 전체 읽기)
-                async with aiofiles.open(file_path, "r", encoding="utf-8") as file:
+                async with aiofiles.open(
+                    file_path, "r", encoding="utf-8", executor=_io_executor()
+                ) as file:
                     content = await file.read()  # ✅ 한 번에 읽기
 
             # 🚀 최적화 2: 배치 보안 검증 (전체 내용 한 번에)
@@ -466,6 +487,18 @@ class SecureEnvLoader:
             raise MemorySecurityError("secure_wipe", str(e))
 
 
+def _wipe_loaders_after_fork() -> None:
+    """Forked children start without the parent's secrets"""
+    for loader in list(_LOADER_REGISTRY):
+        loader.secure_wipe()
+
+
+# Like MADV_WIPEONFORK for the loader's dicts; os.register_at_fork is POSIX-only.
+# Forked workers (gunicorn --preload, multiprocessing "fork") must load again.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_wipe_loaders_after_fork)
+
+
 # Convenience functions
 async def load_secure(
     path: Optional[str] = None, strict: bool = True
@@ -6,13 +6,13 @@ Simple version - syncs to system environment variables
 
 import asyncio
 import os
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, KeysView, Optional, Union
 
 import aiofiles
 
 # Import constants
 from .constants import (
+    ASYNC_READ_THRESHOLD,
     DEFAULT_ENCODING,
     ENV_FILE_PATTERNS,
     EXCLUDED_DIRECTORIES,
@@ -34,8 +34,9 @@ from .exceptions import (
 
 # Import utilities
 from .utils import (
+    _io_executor,
     detect_file_encoding,
-    find_env_files,
+    iter_env_files,
     parse_env_content,
     parse_env_value,
     safe_file_read,
@@ -50,6 +51,8 @@ EnvMap = Dict[str, EnvValue]
 class SimpleEnvLoader:
     """Simple, fast .env loader that syncs to system environment variables"""
 
+    __slots__ = ("env_data",)
+
     def __init__(self):
         """Initialize simple loader"""
         self.env_data: EnvMap = {}
@@ -59,16 +62,23 @@ class SimpleEnvLoader:
         # Use utils function for consistency
         return parse_env_value(value, strict=False)
 
+    def _find_env_file_direct(self, start_path: str, max_depth: int) -> Optional[str]:
+        """Check start directory for .env file without walking the tree"""
+        if max_depth <= 0:
+            return None
+
+        for pattern in ENV_FILE_PATTERNS:
+            candidate = os.path.join(start_path, pattern)
+            if os.path.isfile(candidate) and not os.path.islink(candidate):
+                return candidate
+        return None
+
     async def _find_env_file(
         self, start_path: str = "./", max_depth: int = 2
     ) -> Optional[str]:
         """Find .env file in directory tree"""
-        if not isinstance(start_path, str):
-            raise InvalidInputError("start_path must be string", start_path)
-
-        # Use utils function but return first match only
-        found_files = find_env_files(start_path, max_depth)
-        return found_files[0] if found_files else None
+        # Directory discovery is a handful of stat calls, no need to await
+        return self._find_env_file_sync(start_path, max_depth)
 
     def _find_env_file_sync(
         self, start_path: str = "./", max_depth: int = 2
@@ -77,26 +87,32 @@ class SimpleEnvLoader:
         if not isinstance(start_path, str):
             raise InvalidInputError("start_path must be string", start_path)
 
-        # Use utils function but return first match only
-        found_files = find_env_files(start_path, max_depth)
-        return found_files[0] if found_files else None
+        # Fast path: .env usually sits right in the start directory
+        env_path = self._find_env_file_direct(start_path, max_depth)
+        if env_path:
+            return env_path
+
+        # Use utils function but stop scanning at the first match
+        return next(iter_env_files(start_path, max_depth), None)
 
     async def _parse_file(self, file_path: str) -> EnvMap:
-        """Parse .env file asynchronously"""
+        """Parse .env file asynchronously (large files are parsed off the loop)"""
         if not isinstance(file_path, str):
             raise InvalidInputError("file_path must be string", file_path)
 
         try:
-            # Use utils for safe file reading
-            content, encoding = safe_file_read(file_path)
+            file_size = os.path.getsize(file_path)
+        except OSError:
+            file_size = 0  # Let the sync parser report the error
 
-            # Use utils for parsing
-            return parse_env_content(content, strict=False)
+        # Small files parse faster inline than via a worker thread
+        if file_size < ASYNC_READ_THRESHOLD:
+            return self._parse_file_sync(file_path)
 
-        except (FileNotFoundError, FileParsingError):
-            raise  # Re-raise these specific exceptions
-        except Exception as e:
-            raise FileParsingError(file_path, original_error=e)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _io_executor(), self._parse_file_sync, file_path
+        )
 
     def _parse_file_sync(self, file_path: str) -> EnvMap:
         """Parse .env file synchronously"""
@@ -126,12 +142,12 @@ class SimpleEnvLoader:
         try:
             if path:
                 # Load specific file
-                if not Path(path).exists():
+                if not os.path.isfile(path):
                     raise FileNotFoundError(f"File not found: {path}")
                 env_data = await self._parse_file(path)
             else:
                 # Auto-find .env file
-                env_path = await self._find_env_file(max_depth=max_depth)
+                env_path = self._find_env_file_sync(max_depth=max_depth)
                 if not env_path:
                     raise FileNotFoundError("No .env file found in directory tree")
                 env_data = await self._parse_file(env_path)
@@ -162,7 +178,7 @@ class SimpleEnvLoader:
         try:
             if path:
                 # Load specific file
-                if not Path(path).exists():
+                if not os.path.isfile(path):
                     raise FileNotFoundError(f"File not found: {path}")
                 env_data = self._parse_file_sync(path)
             else:
@@ -264,12 +280,12 @@ class SimpleEnvLoader:
 
         return self.env_data.copy()
 
-    def keys(self) -> List[str]:
-        """Get all available keys"""
+    def keys(self) -> KeysView[str]:
+        """Get all available keys (live view, no copy)"""
         if not self.env_data:
             raise EnvNotLoadedError("keys operation")
 
-        return list(self.env_data.keys())
+        return self.env_data.keys()
 
     def clear(self) -> None:
         """Clear all loaded environment variables (local only, doesn't affect os.environ)"""
@@ -4,19 +4,33 @@ SimpleEnvs: Common utility functions
 Shared utilities for parsing, validation, and file operations
 """
 
+import atexit
+import codecs
 import hashlib
+import heapq
+import io
+import mmap
+import operator
 import os
 import re
+import string
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from .constants import (
     DANGEROUS_PATTERNS,
-    DEFAULT_ENCODING,
     ENV_FILE_PATTERNS,
     EXCLUDED_DIRECTORIES,
     FALSE_VALUES,
+    HASH_BUFFER_SIZE,
+    MMAP_HASH_THRESHOLD,
     PATH_TRAVERSAL_PATTERNS,
+    SCRIPT_INJECTION_PATTERNS,
     SUPPORTED_ENCODINGS,
     TRUE_VALUES,
 )
@@ -31,6 +45,111 @@ from .exceptions import (
 EnvValue = Union[str, int, bool]
 EnvMap = Dict[str, EnvValue]
 
+_item_key = operator.itemgetter(0)
+
+# hashlib.file_digest (Python 3.11+) hashes files in a C-level read loop
+_file_digest = getattr(hashlib, "file_digest", None)
+
+# Direct constructors for common algorithms skip hashlib.new's name lookup
+_HASH_CTORS = {
+    "sha256": hashlib.sha256,
+    "sha1": hashlib.sha1,
+    "sha512": hashlib.sha512,
+    "md5": hashlib.md5,
+}
+
+
+# Shared worker pool for blocking file reads issued from async loaders. Reusing
+# it avoids a fresh default executor for every asyncio.run(); threads are only
+# started on first use. Always fetch it through _io_executor(): a forked child
+# gets a fresh pool because the parent's worker threads do not survive fork.
+def _new_io_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="simpleenvs")
+
+
+_IO_EXECUTOR = _new_io_executor()
+
+
+def _io_executor() -> ThreadPoolExecutor:
+    """Worker pool for blocking reads in the current process"""
+    return _IO_EXECUTOR
+
+
+def _reset_io_executor_after_fork() -> None:
+    global _IO_EXECUTOR
+    _IO_EXECUTOR = _new_io_executor()
+
+
+def _shutdown_io_executor() -> None:
+    _IO_EXECUTOR.shutdown()
+
+
+atexit.register(_shutdown_io_executor)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_io_executor_after_fork)
+
+# find_env_files only starts a thread pool for more uncached directories than this
+_PARALLEL_SCAN_MIN_DIRS = 8
+
+# Longest path validate_path_security accepts (and memoizes)
+_MAX_PATH_LENGTH = 1024
+
+# Directory listings younger than this are not memoized (see _scan_directory)
+_RACY_MTIME_WINDOW_NS = 2 * 10**9
+
+# (env files in pattern priority order, subdirectory paths) for one directory
+ScanResult = Tuple[Tuple[str, ...], Tuple[str, ...]]
+
+# Memoized listings: path -> (stat key, listing), least recently used first.
+# Guarded by a lock because find_env_files scans from worker threads.
+_SCAN_CACHE: "OrderedDict[str, Tuple[Tuple[int, ...], ScanResult]]" = OrderedDict()
+_SCAN_CACHE_LOCK = threading.Lock()
+_SCAN_CACHE_SIZE = 256
+
+# Frozen lookup sets for directory discovery (hot loop runs per directory
+# entry). Snapshotted at import: mutating the constants later has no effect.
+_ENV_FILE_NAMES = frozenset(ENV_FILE_PATTERNS)
+_EXCLUDED_DIRS = frozenset(EXCLUDED_DIRECTORIES)
+
+# Bytes sampled by detect_file_encoding (one default-sized buffer fill)
+_SNIFF_SIZE = io.DEFAULT_BUFFER_SIZE
+
+# Byte order marks to encodings, longest first (UTF-32 LE starts like UTF-16 LE)
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# One KEY=VALUE line as parse_env_line sees it in non-strict mode: key runs to
+# the first '=', comment and empty-key lines never match. Greedy groups keep
+# the regex backtrack-free; surrounding whitespace is stripped by the caller.
+_ENV_LINE_RE = re.compile(r"^[^\S\n]*([^#=\s][^=\n]*)=([^\n]*)", re.MULTILINE)
+
+# Line breaks str.splitlines() honours besides "\n"; content containing any of
+# them takes the per-line path
+_EXTRA_LINE_BREAKS_RE = re.compile("[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+# Characters allowed in normalized keys, and a translate table deleting the rest
+_KEY_KEEP = frozenset(string.ascii_uppercase + string.digits + "_")
+_KEY_DEL_TBL = dict.fromkeys(
+    [ord(c) for c in map(chr, range(256)) if c not in _KEY_KEEP], None
+)
+
+# Strict-mode key format (note: '$' also accepts a single trailing newline)
+_STRICT_KEY_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9_-]*$")
+
+# Superset of decimal float spellings containing '.' (\d covers the Unicode
+# digits float() accepts; misplaced underscores are left to float())
+_FLOAT_CANDIDATE_RE = re.compile(r"[+-]?[\d_]*\.[\d_]*(?:[eE][+-]?[\d_]+)?")
+
+# Lowercased boolean spellings mapped to their value
+_BOOL_VALUES: Dict[str, bool] = {
+    **dict.fromkeys(TRUE_VALUES, True),
+    **dict.fromkeys(FALSE_VALUES, False),
+}
 
 # =============================================================================
 # VALUE PARSING UTILITIES
@@ -67,14 +186,16 @@ def parse_env_value(value: str, strict: bool = False) -> EnvValue:
     if strict:
         validate_value_security(value)
 
-    # Boolean parsing
-    if value.lower() in TRUE_VALUES:
-        return True
-    if value.lower() in FALSE_VALUES:
-        return False
+    # Boolean parsing (single lookup; "1"/"0" resolve to booleans here)
+    flag = _BOOL_VALUES.get(value.lower())
+    if flag is not None:
+        return flag
 
     # Integer parsing with range validation
-    if value.isdigit() or (value.startswith("-") and value[1:].isdigit()):
+    first = value[0]
+    if (first == "-" or first.isdigit()) and (
+        value.isdigit() or (first == "-" and value[1:].isdigit())
+    ):
         try:
             num = int(value)
             # Validate integer range (64-bit signed)
@@ -88,8 +209,9 @@ def parse_env_value(value: str, strict: bool = False) -> EnvValue:
             if strict:
                 raise TypeConversionError("value", value, "integer")
 
-    # Float parsing (optional)
-    if "." in value:
+    # Float parsing (optional); outside strict mode, values that can't be
+    # floats (hostnames, URLs, versions) skip the raise-and-catch
+    if "." in value and (strict or _FLOAT_CANDIDATE_RE.fullmatch(value)):
         try:
             return float(value)
         except ValueError:
@@ -145,7 +267,10 @@ def normalize_env_key(key: str) -> str:
     normalized = key.upper().replace("-", "_")
 
     # Remove invalid characters
-    normalized = re.sub(r"[^A-Z0-9_]", "", normalized)
+    if normalized.isascii():
+        normalized = normalized.translate(_KEY_DEL_TBL)
+    else:
+        normalized = "".join(c for c in normalized if c in _KEY_KEEP)
 
     # Ensure it starts with a letter or underscore
     if normalized and not normalized[0].isalpha() and normalized[0] != "_":
@@ -180,8 +305,7 @@ def validate_value_security(value: str) -> None:
             raise InvalidInputError(f"Dangerous pattern detected: {pattern}", value)
 
     # Check for script injection patterns
-    script_patterns = ["<script", "</script>", "javascript:", "vbscript:"]
-    for pattern in script_patterns:
+    for pattern in SCRIPT_INJECTION_PATTERNS:
         if pattern in value_lower:
             raise InvalidInputError(
                 f"Script injection pattern detected: {pattern}", value
@@ -202,17 +326,34 @@ def validate_path_security(path: str) -> None:
     if not path or not isinstance(path, str):
         raise InvalidInputError("Invalid path type", str(path))
 
+    # Only memoize ordinary paths: oversized or null-byte input is checked
+    # uncached so untrusted strings can't pile up in the cache
+    if len(path) > _MAX_PATH_LENGTH or "\x00" in path:
+        error = _path_security_error.__wrapped__(path)
+    else:
+        error = _path_security_error(path)
+
+    if error is not None:
+        exc_type, message = error
+        raise exc_type(path) if message is None else exc_type(message, path)
+
+
+@lru_cache(maxsize=1024)
+def _path_security_error(path: str) -> Optional[Tuple[type, Optional[str]]]:
+    """Memoized path checks; returns (exception type, message) to raise, if any"""
     # Check for path traversal patterns
     for pattern in PATH_TRAVERSAL_PATTERNS:
         if pattern in path:
-            raise PathTraversalError(path)
+            return PathTraversalError, None
 
     # Additional checks
     if "\x00" in path:
-        raise InvalidInputError("Null byte in path", path)
+        return InvalidInputError, "Null byte in path"
 
-    if len(path) > 1024:
-        raise InvalidInputError("Path too long", path)
+    if len(path) > _MAX_PATH_LENGTH:
+        return InvalidInputError, "Path too long"
+
+    return None
 
 
 def validate_key_format(key: str, strict: bool = True) -> None:
@@ -229,14 +370,24 @@ def validate_key_format(key: str, strict: bool = True) -> None:
     if not key or not isinstance(key, str):
         raise InvalidInputError("Key must be non-empty string", str(key))
 
+    error = _key_format_error(key, strict)
+    if error is not None:
+        raise InvalidInputError(error, key)
+
+
+@lru_cache(maxsize=2048)
+def _key_format_error(key: str, strict: bool) -> Optional[str]:
+    """Memoized key checks; returns the error message, if any"""
     if strict:
         # Strict validation: alphanumeric + underscore + hyphen only
-        if not re.match(r"^[a-zA-Z][a-zA-Z0-9_-]*$", key):
-            raise InvalidInputError("Key contains invalid characters", key)
+        if not _STRICT_KEY_RE.match(key):
+            return "Key contains invalid characters"
     else:
         # Relaxed validation: just check for dangerous characters
         if any(char in key for char in ["=", "\n", "\r", "\x00"]):
-            raise InvalidInputError("Key contains dangerous characters", key)
+            return "Key contains dangerous characters"
+
+    return None
 
 
 # =============================================================================
@@ -244,56 +395,218 @@ def validate_key_format(key: str, strict: bool = True) -> None:
 # =============================================================================
 
 
-def find_env_files(start_path: str = "./", max_depth: int = 3) -> List[str]:
+def _scan_directory(path: str) -> ScanResult:
+    """
+    List one directory for env files and searchable subdirectories
+
+    Listings are memoized per directory identity and mtime/ctime: adding,
+    removing or renaming an entry bumps both, and resetting the mtime still
+    bumps the ctime. Directories changed within the last couple of seconds
+    are listed uncached, since a coarse timestamp cannot tell a change made
+    right after the scan from the scan itself (git's "racy" index rule).
+
+    Args:
+        path: Directory path
+
+    Returns:
+        Tuple of (env files in pattern priority order, subdirectory paths)
+    """
+    key, cached = _lookup_scan(path)
+    if key is None:
+        return (), ()  # Missing or inaccessible directory
+    if cached is not None:
+        return cached
+    return _scan_and_store(path, key)
+
+
+def _lookup_scan(path: str) -> Tuple[Optional[Tuple[int, ...]], Optional[ScanResult]]:
+    """Stat a directory and return (cache key, memoized listing or None)"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None, None
+
+    key = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_ctime_ns)
+    with _SCAN_CACHE_LOCK:
+        entry = _SCAN_CACHE.get(path)
+        if entry is None or entry[0] != key:
+            return key, None
+        _SCAN_CACHE.move_to_end(path)
+        return key, entry[1]
+
+
+def _scan_and_store(path: str, key: Tuple[int, ...]) -> ScanResult:
+    """List a directory and memoize it unless it changed too recently"""
+    result = _list_directory(path)
+
+    if time.time_ns() - max(key[2], key[3]) >= _RACY_MTIME_WINDOW_NS:
+        with _SCAN_CACHE_LOCK:
+            _SCAN_CACHE[path] = (key, result)
+            _SCAN_CACHE.move_to_end(path)
+            if len(_SCAN_CACHE) > _SCAN_CACHE_SIZE:
+                _SCAN_CACHE.popitem(last=False)
+    return result
+
+
+def _list_directory(path: str) -> ScanResult:
+    """Uncached directory listing behind _scan_directory"""
+    matches: Dict[str, str] = {}
+    subdirs: List[str] = []
+
+    try:
+        # One listing per directory: DirEntry caches the file type from
+        # readdir, so neither env files nor subdirectories need extra stats
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name in _ENV_FILE_NAMES and entry.is_file(follow_symlinks=False):
+                    matches[name] = entry.path
+                elif entry.is_dir(follow_symlinks=False) and name not in _EXCLUDED_DIRS:
+                    subdirs.append(entry.path)
+
+    except (OSError, PermissionError):
+        return (), ()  # Skip inaccessible directories
+
+    found = tuple(
+        matches[pattern] for pattern in ENV_FILE_PATTERNS if pattern in matches
+    )
+    return found, tuple(subdirs)
+
+
+def _clear_caches() -> None:
+    """Forget memoized directory listings and validation results"""
+    with _SCAN_CACHE_LOCK:
+        _SCAN_CACHE.clear()
+    _path_security_error.cache_clear()
+    _key_format_error.cache_clear()
+
+
+def iter_env_files(start_path: str = "./", max_depth: int = 3) -> Iterator[str]:
+    """
+    Lazily iterate over .env files in directory tree
+
+    Args:
+        start_path: Starting directory path
+        max_depth: Maximum search depth
+
+    Yields:
+        Found .env file paths, scanning stops as soon as the caller does
+    """
+    # Explicit depth-first stack: no frame per directory, no recursion limit
+    stack = [(start_path, max_depth)]
+    while stack:
+        path, depth = stack.pop()
+        if depth <= 0:
+            continue
+
+        found, subdirs = _scan_directory(path)
+        yield from found
+
+        # Push in reverse so subdirectories are visited in listing order
+        if depth > 1:
+            stack.extend((subdir, depth - 1) for subdir in reversed(subdirs))
+
+
+def find_env_files(
+    start_path: str = "./", max_depth: int = 3, max_workers: Optional[int] = None
+) -> List[str]:
     """
     Find all .env files in directory tree
 
+    Directories are scanned level by level. Memoized listings are reused
+    inline; only when more than _PARALLEL_SCAN_MIN_DIRS directories of a level
+    need a real scan are they fanned out to a thread pool (scandir releases
+    the GIL), since starting threads costs more than a few scans.
+    Results are assembled in the same order as iter_env_files.
+
     Args:
         start_path: Starting directory path
         max_depth: Maximum search depth
+        max_workers: Thread pool size (default: min(32, cpu_count * 4))
 
     Returns:
         List of found .env file paths
     """
-    found_files = []
+    if max_depth <= 1:
+        return list(iter_env_files(start_path, max_depth))
 
-    def _search_directory(path: Path, depth: int) -> None:
-        if depth <= 0:
-            return
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
 
-        if not path.exists() or not path.is_dir():
-            return
+    scans: Dict[str, ScanResult] = {}
+    level = [start_path]
+    executor: Optional[ThreadPoolExecutor] = None
+    try:
+        for _ in range(max_depth):
+            if not level:
+                break
+
+            # Memoized listings cost one stat; only real scans need threads
+            misses: List[Tuple[str, Tuple[int, ...]]] = []
+            for path in level:
+                key, cached = _lookup_scan(path)
+                if key is None:
+                    scans[path] = ((), ())
+                elif cached is not None:
+                    scans[path] = cached
+                else:
+                    misses.append((path, key))
+
+            if max_workers > 1 and len(misses) > _PARALLEL_SCAN_MIN_DIRS:
+                if executor is None:
+                    executor = ThreadPoolExecutor(max_workers=max_workers)
+                results = list(
+                    executor.map(lambda miss: _scan_and_store(*miss), misses)
+                )
+            else:
+                results = [_scan_and_store(path, key) for path, key in misses]
+            scans.update(zip((path for path, _ in misses), results))
+
+            level = [subdir for path in level for subdir in scans[path][1]]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    # Assemble depth-first, matching iter_env_files ordering
+    found_files: List[str] = []
+    stack = [start_path]
+    while stack:
+        found, subdirs = scans[stack.pop()]
+        found_files.extend(found)
+        stack.extend(subdir for subdir in reversed(subdirs) if subdir in scans)
 
-        try:
-            # Check for env files in current directory
-            for pattern in ENV_FILE_PATTERNS:
-                env_file = path / pattern
-                if (
-                    env_file.exists()
-                    and env_file.is_file()
-                    and not env_file.is_symlink()
-                ):
-                    found_files.append(str(env_file))
-
-            # Search subdirectories
-            for item in path.iterdir():
-                if (
-                    item.is_dir()
-                    and not item.is_symlink()
-                    and item.name not in EXCLUDED_DIRECTORIES
-                ):
-                    _search_directory(item, depth - 1)
-
-        except (OSError, PermissionError):
-            pass  # Skip inaccessible directories
-
-    _search_directory(Path(start_path), max_depth)
     return found_files
 
 
+def _decode_bytes(data: bytes, final: bool = True) -> Optional[Tuple[str, str]]:
+    """
+    Decode raw file bytes with the first supported encoding that works
+
+    Args:
+        data: File content (or its leading bytes)
+        final: Whether data holds the complete file content
+
+    Returns:
+        Tuple of (decoded_text, encoding), or None if no encoding works
+    """
+    # A byte order mark picks the encoding without trial decoding
+    encodings = [enc for bom, enc in _BOM_ENCODINGS if data.startswith(bom)][:1]
+    encodings.extend(SUPPORTED_ENCODINGS)
+
+    for encoding in encodings:
+        try:
+            # Incremental decoder tolerates a multi-byte char cut at the end
+            decoder = codecs.getincrementaldecoder(encoding)()
+            return decoder.decode(data, final), encoding
+        except UnicodeDecodeError:
+            continue
+
+    return None
+
+
 def detect_file_encoding(file_path: str) -> str:
     """
-    Detect file encoding by trying multiple encodings
+    Detect file encoding from its byte order mark or by trying multiple encodings
 
     Args:
         file_path: Path to file
@@ -304,29 +617,31 @@ def detect_file_encoding(file_path: str) -> str:
     Raises:
         FileParsingError: If no supported encoding works
     """
-    for encoding in SUPPORTED_ENCODINGS:
-        try:
-            with open(file_path, "r", encoding=encoding) as f:
-                # Try to read a chunk to verify encoding
-                f.read(1024)
-            return encoding
-        except UnicodeDecodeError:
-            continue
-        except Exception:
-            break
+    try:
+        # Unbuffered: one read() syscall fills the sniff window directly
+        with open(file_path, "rb", buffering=0) as f:
+            decoded = _decode_bytes(f.read(_SNIFF_SIZE), final=False)
+    except Exception:
+        decoded = None
 
-    raise FileParsingError(
-        file_path, original_error=Exception("No supported encoding found")
-    )
+    if decoded is None:
+        raise FileParsingError(
+            file_path, original_error=Exception("No supported encoding found")
+        )
+    return decoded[1]
 
 
-def calculate_file_hash(file_path: str, algorithm: str = "sha256") -> str:
+def calculate_file_hash(
+    file_path: str, algorithm: str = "sha256", chunk_size: int = HASH_BUFFER_SIZE
+) -> str:
     """
     Calculate file hash for integrity checking
 
     Args:
         file_path: Path to file
         algorithm: Hash algorithm ('sha256', 'md5', etc.)
+        chunk_size: Read buffer size in bytes, rounded up to the filesystem
+            block size (used when file_digest is unavailable)
 
     Returns:
         Hexadecimal hash string
@@ -339,13 +654,36 @@ def calculate_file_hash(file_path: str, algorithm: str = "sha256") -> str:
         raise FileNotFoundError(f"File not found: {file_path}")
 
     try:
-        hasher = hashlib.new(algorithm)
+        ctor = _HASH_CTORS.get(algorithm)
+        hasher = ctor() if ctor is not None else hashlib.new(algorithm)
     except ValueError:
         raise ValueError(f"Unsupported hash algorithm: {algorithm}")
 
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hasher.update(chunk)
+        st = os.fstat(f.fileno())
+        if st.st_size >= MMAP_HASH_THRESHOLD:
+            # Large files: hash the whole mapping in one update, no copies
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                hasher.update(mapped)
+            return hasher.hexdigest()
+
+        if _file_digest is not None:
+            return _file_digest(f, lambda: hasher).hexdigest()
+
+        # Round the chunk up to whole filesystem blocks (st_blksize is
+        # missing on Windows) and reuse one preallocated buffer
+        block_size = getattr(st, "st_blksize", 0) or 1
+        chunk_size = max(chunk_size, block_size)
+        chunk_size += -chunk_size % block_size
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            hasher.update(view[:size])
 
     return hasher.hexdigest()
 
@@ -364,12 +702,12 @@ def safe_file_read(file_path: str, max_size: int = 10 * 1024 * 1024) -> Tuple[st
     Raises:
         FileParsingError: If file too large or can't be read
     """
-    path_obj = Path(file_path)
-
-    if not path_obj.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    # One stat call covers both the existence and the size check
+    try:
+        file_size = os.stat(file_path).st_size
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"File not found: {file_path}") from None
 
-    file_size = path_obj.stat().st_size
     if file_size > max_size:
         raise FileParsingError(
             file_path,
@@ -378,21 +716,44 @@ def safe_file_read(file_path: str, max_size: int = 10 * 1024 * 1024) -> Tuple[st
             ),
         )
 
-    encoding = detect_file_encoding(file_path)
-
+    # Read once as bytes and detect the encoding on the resident buffer
     try:
-        with open(file_path, "r", encoding=encoding) as f:
-            content = f.read()
-        return content, encoding
+        with open(file_path, "rb") as f:
+            raw = f.read(max_size + 1)
     except Exception as e:
         raise FileParsingError(file_path, original_error=e)
 
+    if len(raw) > max_size:  # File grew after the size check
+        raise FileParsingError(
+            file_path,
+            original_error=Exception(f"File too large (max: {max_size} bytes)"),
+        )
+
+    decoded = _decode_bytes(raw)
+    if decoded is None:
+        raise FileParsingError(
+            file_path, original_error=Exception("No supported encoding found")
+        )
+
+    # Normalize newlines like text-mode reading did
+    content, encoding = decoded
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content, encoding
+
 
 # =============================================================================
 # PARSING UTILITIES
 # =============================================================================
 
 
+def _strip_quotes(value: str) -> str:
+    """Remove one pair of matching surrounding quotes"""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
 def parse_env_line(
     line: str, line_number: int = 0, strict: bool = False
 ) -> Optional[Tuple[str, EnvValue]]:
@@ -410,24 +771,24 @@ def parse_env_line(
     Raises:
         FileParsingError: If parsing fails in strict mode
     """
-    line = line.strip()
+    line = line.lstrip()
 
     # Skip empty lines and comments
-    if not line or line.startswith("#"):
+    if not line or line[0] == "#":
         return None
 
     # Must contain '='
-    if "=" not in line:
+    eq = line.find("=")
+    if eq < 0:
         if strict:
             raise FileParsingError(
                 "", line_number, Exception("Line missing '=' separator")
             )
         return None
 
-    # Split on first '='
-    key, _, value = line.partition("=")
-    key = key.strip()
-    value = value.strip()
+    # Split on first '=' (leading whitespace is already gone)
+    key = line[:eq].rstrip()
+    value = line[eq + 1 :].strip()
 
     if not key:
         if strict:
@@ -439,11 +800,7 @@ def parse_env_line(
         validate_key_format(key, strict=True)
 
     # Remove quotes if present
-    if len(value) >= 2:
-        if (value.startswith('"') and value.endswith('"')) or (
-            value.startswith("'") and value.endswith("'")
-        ):
-            value = value[1:-1]
+    value = _strip_quotes(value)
 
     # Parse value
     try:
@@ -470,14 +827,22 @@ def parse_env_content(content: str, strict: bool = False) -> EnvMap:
     Raises:
         FileParsingError: If parsing fails
     """
-    env_data = {}
+    # Non-strict fast path: let the regex engine find KEY=VALUE lines
+    if not strict and not _EXTRA_LINE_BREAKS_RE.search(content):
+        return {
+            key.rstrip(): parse_env_value(_strip_quotes(value.strip()))
+            for key, value in _ENV_LINE_RE.findall(content)
+        }
+
+    # Collect pairs first and build the dict in one shot
+    pairs: List[Tuple[str, EnvValue]] = []
+    append = pairs.append
 
     for line_number, line in enumerate(content.splitlines(), 1):
         try:
             result = parse_env_line(line, line_number, strict)
             if result:
-                key, value = result
-                env_data[key] = value
+                append(result)
         except FileParsingError:
             raise  # Re-raise with line number info
         except Exception as e:
@@ -486,7 +851,7 @@ def parse_env_content(content: str, strict: bool = False) -> EnvMap:
             # In non-strict mode, skip problematic lines
             continue
 
-    return env_data
+    return dict(pairs)
 
 
 # =============================================================================
@@ -494,12 +859,15 @@ def parse_env_content(content: str, strict: bool = False) -> EnvMap:
 # =============================================================================
 
 
-def get_env_info(env_data: EnvMap) -> Dict[str, Any]:
+def get_env_info(
+    env_data: EnvMap, sort_keys_limit: Optional[int] = None
+) -> Dict[str, Any]:
     """
     Get information about environment data
 
     Args:
         env_data: Environment variables dictionary
+        sort_keys_limit: Only return the first N keys in sorted order
 
     Returns:
         Information dictionary
@@ -507,19 +875,30 @@ def get_env_info(env_data: EnvMap) -> Dict[str, Any]:
     if not env_data:
         return {"count": 0, "types": {}, "keys": []}
 
-    type_counts = {}
-    for value in env_data.values():
+    # Single pass over the items for type counts and length maxima
+    type_counts: Dict[str, int] = {}
+    get_count = type_counts.get
+    max_key_length = 0
+    max_value_length = 0
+    for key, value in env_data.items():
         type_name = type(value).__name__
-        type_counts[type_name] = type_counts.get(type_name, 0) + 1
+        type_counts[type_name] = get_count(type_name, 0) + 1
+        if len(key) > max_key_length:
+            max_key_length = len(key)
+        value_length = len(value if type(value) is str else str(value))
+        if value_length > max_value_length:
+            max_value_length = value_length
 
     return {
         "count": len(env_data),
         "types": type_counts,
-        "keys": sorted(env_data.keys()),
-        "max_key_length": max(len(k) for k in env_data.keys()) if env_data else 0,
-        "max_value_length": (
-            max(len(str(v)) for v in env_data.values()) if env_data else 0
+        "keys": (
+            sorted(env_data)
+            if sort_keys_limit is None
+            else heapq.nsmallest(sort_keys_limit, env_data)
         ),
+        "max_key_length": max_key_length,
+        "max_value_length": max_value_length,
     }
 
 
@@ -534,14 +913,14 @@ def format_env_summary(env_data: EnvMap, show_values: bool = False) -> str:
     Returns:
         Formatted summary string
     """
-    info = get_env_info(env_data)
+    # Only the first 10 keys are shown, so avoid sorting all of them
+    info = get_env_info(env_data, sort_keys_limit=10)
 
     lines = [
         f"Environment Variables Summary:",
         f"  Total: {info['count']} variables",
         f"  Types: {info['types']}",
-        f"  Keys: {', '.join(info['keys'][:10])}"
-        + ("..." if len(info["keys"]) > 10 else ""),
+        f"  Keys: {', '.join(info['keys'])}" + ("..." if info["count"] > 10 else ""),
     ]
 
     if show_values and env_data:
@@ -571,6 +950,15 @@ def validate_env_completeness(env_data: EnvMap, required_keys: List[str]) -> Lis
 # =============================================================================
 
 
+# Characters escaped inside double-quoted .env values
+_ESCAPE_TABLE = str.maketrans({'"': '\\"'})
+
+
+def _sorted_items(env_data: EnvMap) -> List[Tuple[str, EnvValue]]:
+    """Return items ordered by key (keys are unique, so values are never compared)"""
+    return sorted(env_data.items(), key=_item_key)
+
+
 def export_to_shell_format(env_data: EnvMap, quote_values: bool = True) -> str:
     """
     Export environment variables to shell format
@@ -582,13 +970,10 @@ def export_to_shell_format(env_data: EnvMap, quote_values: bool = True) -> str:
     Returns:
         Shell export statements
     """
-    lines = []
-    for key, value in sorted(env_data.items()):
-        if quote_values:
-            lines.append(f'export {key}="{value}"')
-        else:
-            lines.append(f"export {key}={value}")
-    return "\n".join(lines)
+    items = _sorted_items(env_data)
+    if quote_values:
+        return "\n".join([f'export {key}="{value}"' for key, value in items])
+    return "\n".join([f"export {key}={value}" for key, value in items])
 
 
 def export_to_env_format(env_data: EnvMap) -> str:
@@ -602,13 +987,15 @@ def export_to_env_format(env_data: EnvMap) -> str:
         .env format string
     """
     lines = []
-    for key, value in sorted(env_data.items()):
-        if isinstance(value, str) and (" " in value or '"' in value or "'" in value):
-            # Quote values with spaces or quotes
-            escaped_value = value.replace('"', '\\"')
-            lines.append(f'{key}="{escaped_value}"')
+    append = lines.append
+    for key, value in _sorted_items(env_data):
+        if type(value) is str and (" " in value or '"' in value or "'" in value):
+            # Quote values with spaces or quotes; only escape when needed
+            if '"' in value:
+                value = value.translate(_ESCAPE_TABLE)
+            append(f'{key}="{value}"')
         else:
-            lines.append(f"{key}={value}")
+            append(f"{key}={value}")
     return "\n".join(lines)
 
 
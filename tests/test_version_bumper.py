@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Tests for the release helper script version_bumper.py
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[1] / "version_bumper.py"
+
+
+@pytest.fixture(scope="module")
+def version_bumper():
+    """Import version_bumper.py from the repository root"""
+    spec = importlib.util.spec_from_file_location("version_bumper", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestAutoDetectBumpType:
+    """Test commit subject classification"""
+
+    @pytest.mark.parametrize(
+        "commits, expected",
+        [
+            ([], "patch"),
+            (["fix: handle empty values"], "patch"),
+            (["fix: non-breaking tweak"], "patch"),
+            (["docs: note breaking behaviour in tests"], "patch"),
+            (["Feat: add loader option", "fix: typo"], "minor"),
+            (["feat: new api", "BREAKING CHANGE: drop 3.7"], "major"),
+            (["refactor!: rename loader"], "major"),
+            (["chore: Breaking Change in config"], "major"),
+        ],
+    )
+    def test_auto_detect_bump_type(self, version_bumper, commits, expected):
+        """Test keyword matching, including the case-sensitive BREAKING"""
+        bumper = version_bumper.VersionBumper()
+        bumper.get_recent_commits = lambda: commits
+        assert bumper.auto_detect_bump_type() == expected
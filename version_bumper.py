@@ -12,21 +12,64 @@ import re
 import subprocess
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+try:
+    import pygit2
+except ImportError:  # Optional: fall back to the git CLI
+    pygit2 = None
+
+
+def _keyword_regex(keywords: List[str]) -> "re.Pattern":
+    """Compile keywords into one alternation"""
+    # All-caps keywords (BREAKING) match exactly so "non-breaking" stays a
+    # non-major subject; the rest ignore case like the old lowercase scan
+    return re.compile(
+        "|".join(
+            re.escape(keyword) if keyword.isupper() else f"(?i:{re.escape(keyword)})"
+            for keyword in keywords
+        )
+    )
 
 
 class VersionBumper:
+    # Keywords for different bump types
+    MAJOR_KEYWORDS = ["BREAKING", "breaking change", "major:", "!:"]
+    MINOR_KEYWORDS = ["feat:", "feature:", "minor:", "add:", "new:"]
+    PATCH_KEYWORDS = [
+        "fix:",
+        "patch:",
+        "docs:",
+        "doc:",
+        "chore:",
+        "style:",
+        "refactor:",
+        "test:",
+    ]
+
     def __init__(self):
         self.constants_file = Path("src/simpleenvs/constants.py")
         self.version_pattern = r'VERSION = ["\']([0-9]+\.[0-9]+\.[0-9]+)["\']'
-
-    def get_current_version(self) -> str:
-        """Get current version from constants.py"""
+        self._version_re = re.compile(self.version_pattern)
+        self._major_re = _keyword_regex(self.MAJOR_KEYWORDS)
+        self._minor_re = _keyword_regex(self.MINOR_KEYWORDS)
+        self._patch_re = _keyword_regex(self.PATCH_KEYWORDS)
+        self._last_tag: Optional[str] = None
+        self._last_tag_cached = False
+
+    def read_constants(self) -> str:
+        """Read constants.py once so callers can share the content"""
         if not self.constants_file.exists():
             raise FileNotFoundError(f"Constants file not found: {self.constants_file}")
 
-        content = self.constants_file.read_text()
-        match = re.search(self.version_pattern, content)
+        return self.constants_file.read_text()
+
+    def get_current_version(self, content: Optional[str] = None) -> str:
+        """Get current version from constants.py"""
+        if content is None:
+            content = self.read_constants()
+
+        match = self._version_re.search(content)
         if not match:
             raise ValueError("Version not found in constants.py")
 
@@ -34,11 +77,12 @@ class VersionBumper:
 
     def parse_version(self, version: str) -> Tuple[int, int, int]:
         """Parse version string into tuple"""
-        parts = version.split(".")
-        if len(parts) != 3:
-            raise ValueError(f"Invalid version format: {version}")
+        try:
+            major, minor, patch = version.split(".")
+        except ValueError:
+            raise ValueError(f"Invalid version format: {version}") from None
 
-        return tuple(int(part) for part in parts)
+        return int(major), int(minor), int(patch)
 
     def bump_version(self, current: str, bump_type: str) -> str:
         """Bump version based on type"""
@@ -53,14 +97,23 @@ class VersionBumper:
         else:
             raise ValueError(f"Invalid bump type: {bump_type}")
 
-    def update_constants_file(self, new_version: str) -> None:
+    def update_constants_file(
+        self,
+        new_version: str,
+        content: Optional[str] = None,
+        old_version: Optional[str] = None,
+    ) -> None:
         """Update VERSION in constants.py"""
-        content = self.constants_file.read_text()
-
-        # Replace version
-        new_content = re.sub(
-            self.version_pattern, f'VERSION = "{new_version}"', content
-        )
+        if content is None:
+            content = self.read_constants()
+
+        # Replace version: swap the known literal directly, regex otherwise
+        new_line = f'VERSION = "{new_version}"'
+        new_content = content
+        if old_version is not None:
+            new_content = content.replace(f'VERSION = "{old_version}"', new_line, 1)
+        if new_content == content:
+            new_content = self._version_re.sub(new_line, content)
 
         if new_content == content:
             raise ValueError("Failed to update version in constants.py")
@@ -70,6 +123,12 @@ class VersionBumper:
 
     def get_recent_commits(self, since_tag: str = None) -> List[str]:
         """Get recent commit messages"""
+        if pygit2 is not None:
+            try:
+                return self._walk_recent_commits(since_tag)
+            except (pygit2.GitError, KeyError, ValueError):
+                pass  # Not a repository or unknown tag: let git report it
+
         try:
             if since_tag:
                 cmd = [
@@ -89,40 +148,40 @@ class VersionBumper:
             pass
         return []
 
+    def _walk_recent_commits(self, since_tag: Optional[str] = None) -> List[str]:
+        """Read commit subjects in-process with libgit2 (no git subprocess)"""
+        repo = pygit2.Repository(".")
+        walker = repo.walk(repo.head.target, pygit2.GIT_SORT_TIME)
+
+        if since_tag:
+            # Same range as `git log <tag>..HEAD`
+            walker.hide(repo.revparse_single(since_tag).peel(pygit2.Commit).id)
+            limit = None
+        else:
+            limit = 10
+
+        subjects = []
+        for commit in walker:
+            subjects.append(commit.message.split("\n", 1)[0])
+            if len(subjects) == limit:
+                break
+        return subjects
+
     def auto_detect_bump_type(self) -> str:
         """Auto-detect bump type based on commit messages"""
         commits = self.get_recent_commits()
 
-        # Keywords for different bump types
-        major_keywords = ["BREAKING", "breaking change", "major:", "!:"]
-        minor_keywords = ["feat:", "feature:", "minor:", "add:", "new:"]
-        patch_keywords = [
-            "fix:",
-            "patch:",
-            "docs:",
-            "doc:",
-            "chore:",
-            "style:",
-            "refactor:",
-            "test:",
-        ]
-
-        has_major = any(
-            any(keyword in commit.lower() for keyword in major_keywords)
-            for commit in commits
-        )
-        has_minor = any(
-            any(keyword in commit.lower() for keyword in minor_keywords)
-            for commit in commits
-        )
-        has_patch = any(
-            any(keyword in commit.lower() for keyword in patch_keywords)
-            for commit in commits
-        )
-
-        if has_major:
-            return "major"
-        elif has_minor:
+        # One case-insensitive scan per commit; the first major hit wins
+        has_minor = has_patch = False
+        for commit in commits:
+            if self._major_re.search(commit):
+                return "major"
+            if not has_minor and self._minor_re.search(commit):
+                has_minor = True
+            elif not has_patch and self._patch_re.search(commit):
+                has_patch = True
+
+        if has_minor:
             return "minor"
         elif has_patch or commits:  # Default to patch if any commits
             return "patch"
@@ -130,7 +189,11 @@ class VersionBumper:
             return "patch"  # Safe default
 
     def get_last_git_tag(self) -> str:
-        """Get the last git tag"""
+        """Get the last git tag (looked up once per bumper)"""
+        if self._last_tag_cached:
+            return self._last_tag
+
+        tag = None
         try:
             result = subprocess.run(
                 ["git", "describe", "--tags", "--abbrev=0"],
@@ -138,10 +201,13 @@ class VersionBumper:
                 text=True,
             )
             if result.returncode == 0:
-                return result.stdout.strip().lstrip("v")
+                tag = result.stdout.strip().lstrip("v")
         except Exception:
             pass
-        return None
+
+        self._last_tag = tag
+        self._last_tag_cached = True
+        return tag
 
     def create_git_tag(self, version: str, push: bool = False) -> None:
         """Create git tag for new version"""
@@ -153,6 +219,7 @@ class VersionBumper:
                 ["git", "tag", "-a", tag_name, "-m", f"Release {version}"], check=True
             )
             print(f"✅ Created git tag: {tag_name}")
+            self._last_tag_cached = False  # The new tag is now the last one
 
             if push:
                 # Push tag
@@ -166,8 +233,9 @@ class VersionBumper:
         self, bump_type: str, create_tag: bool = False, push_tag: bool = False
     ) -> str:
         """Main bump function"""
-        # Get current version
-        current_version = self.get_current_version()
+        # Get current version (constants.py is read only once per bump)
+        content = self.read_constants()
+        current_version = self.get_current_version(content)
         print(f"📦 Current version: {current_version}")
 
         # Auto-detect if requested
@@ -180,7 +248,7 @@ class VersionBumper:
         print(f"🚀 New version: {new_version}")
 
         # Update files
-        self.update_constants_file(new_version)
+        self.update_constants_file(new_version, content, current_version)
 
         # Create git tag if requested
         if create_tag: